@@ -4,9 +4,12 @@ A Python client for creating, retrieving, searching, and managing
 tickets in the Lansweeper Helpdesk system.
 """
 
+import logging
+
 from lansweeper_helpdesk.client import HelpdeskAPI
 from lansweeper_helpdesk.exceptions import (
     APIError,
+    CircuitOpenError,
     ConfigurationError,
     HelpdeskError,
     TicketNotFoundError,
@@ -15,9 +18,13 @@ from lansweeper_helpdesk.types import NoteType, TicketState
 
 __version__ = "0.1.0"
 
+# Library logging: stay silent unless the application configures a handler.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __all__ = [
     "HelpdeskAPI",
     "APIError",
+    "CircuitOpenError",
     "ConfigurationError",
     "HelpdeskError",
     "TicketNotFoundError",
@@ -0,0 +1,546 @@
+"""Asynchronous Lansweeper Helpdesk API client.
+
+Requires the optional ``async`` extra::
+
+    pip install "lansweeper-helpdesk[async]"
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "AsyncHelpdeskAPI requires httpx. Install it with: pip install 'lansweeper-helpdesk[async]'"
+    ) from exc
+
+from lansweeper_helpdesk.client import (
+    _DEBUG_BODY_LIMIT,
+    _backoff_delay,
+    _is_retryable_status,
+    _load_ssl_context,
+    _parse_body,
+    _process_ticket,
+    _redact,
+    _retry_after_seconds,
+)
+from lansweeper_helpdesk.exceptions import APIError, ConfigurationError
+from lansweeper_helpdesk.types import APIResponse
+
+logger = logging.getLogger(__name__)
+
+# Connection limits for the shared HTTP/2 client.
+_MAX_CONNECTIONS = 50
+_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncHelpdeskAPI:
+    """Asynchronous client for bulk operations against the Lansweeper Helpdesk API.
+
+    A single ``httpx.AsyncClient`` (HTTP/2, pooled keep-alive connections) is
+    shared by all calls, and bulk methods run their requests concurrently with
+    at most ``max_concurrency`` in flight.
+
+    Args:
+        base_url: The base URL of the Lansweeper Helpdesk API
+            (e.g. ``"https://helpdesk.example.com:443/api.aspx"``).
+        api_key: API key for authentication.
+        cert_path: Optional path to an SSL certificate file for verification.
+            When ``None``, standard certificate verification is used.
+        ssl_context: Optional preloaded ``ssl.SSLContext`` used to verify the
+            server, as an alternative to ``cert_path``.
+        max_concurrency: Maximum number of requests in flight during bulk calls.
+        max_retries: How many times a request is retried, with the same policy
+            as :class:`~lansweeper_helpdesk.HelpdeskAPI`. ``0`` disables retries.
+        backoff_base: Delay in seconds before the first retry; it doubles for
+            each further retry.
+        backoff_max: Upper bound in seconds for a single backoff delay,
+            including delays requested by ``Retry-After``.
+        backoff_jitter: Maximum random delay in seconds added to each backoff.
+        timeout: Seconds to wait for the server, either a single value or a
+            ``(connect, read)`` tuple, as for
+            :class:`~lansweeper_helpdesk.HelpdeskAPI`.
+        strict_html: Strip HTML with a full BeautifulSoup parse instead of the
+            default regular expression.
+        debug_bodies: Also log the first 2 KB of each response body at
+            ``DEBUG`` level.
+        transport: Optional custom ``httpx`` transport (useful for testing).
+
+    Raises:
+        ConfigurationError: If ``base_url`` or ``api_key`` is not provided, if
+            ``cert_path`` is not a valid certificate file, or if both
+            ``cert_path`` and ``ssl_context`` are given.
+        FileNotFoundError: If ``cert_path`` is given but the file does not exist.
+
+    Example::
+
+        from lansweeper_helpdesk.async_client import AsyncHelpdeskAPI
+
+        async with AsyncHelpdeskAPI(
+            base_url="https://helpdesk.example.com:443/api.aspx",
+            api_key="your-api-key",
+        ) as api:
+            tickets = await api.get_tickets_bulk(["1", "2", "3"])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        cert_path: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        max_concurrency: int = 20,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        backoff_jitter: float = 0.5,
+        timeout: float | tuple[float, float] = (10.0, 60.0),
+        strict_html: bool = False,
+        debug_bodies: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if not base_url:
+            raise ConfigurationError("base_url must be provided.")
+        if not api_key:
+            raise ConfigurationError("api_key must be provided.")
+        if cert_path is not None and ssl_context is not None:
+            raise ConfigurationError("Pass either cert_path or ssl_context, not both.")
+
+        self.base_url = base_url
+        self._base_params: dict[str, str] = {"Key": api_key}
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self.timeout = timeout
+        self.strict_html = strict_html
+        self.debug_bodies = debug_bodies
+
+        self._verify: ssl.SSLContext | bool = True
+        if cert_path is not None:
+            self._verify = _load_ssl_context(cert_path)
+        elif ssl_context is not None:
+            self._verify = ssl_context
+
+        self._transport = transport
+        self.client = self._new_client()
+
+    @property
+    def api_key(self) -> str:
+        """API key sent with every request."""
+        return self._base_params["Key"]
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._base_params = {"Key": value}
+
+    async def __aenter__(self) -> AsyncHelpdeskAPI:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create an ``httpx.AsyncClient`` configured for this API."""
+        return httpx.AsyncClient(
+            verify=self._verify,
+            http2=True,
+            timeout=self._httpx_timeout(),
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            transport=self._transport,
+        )
+
+    def _httpx_timeout(self) -> httpx.Timeout:
+        """Map ``timeout`` onto ``httpx.Timeout``, as requests does."""
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(self.timeout)
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        action: str,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+    ) -> APIResponse | str:
+        """Make an HTTP request to the Lansweeper Helpdesk API.
+
+        Connection errors, ``429`` and ``5xx`` responses are retried with
+        jittered exponential backoff or the server's ``Retry-After``; POSTs are
+        only retried on connection errors and ``429``/``503`` with
+        ``Retry-After``.
+
+        Args:
+            client: The HTTP client to send the request with.
+            action: The API action to perform (e.g. ``"GetTicket"``).
+            method: HTTP method — ``"GET"`` or ``"POST"``.
+            params: Extra query/form parameters.
+
+        Returns:
+            Parsed JSON response as a dict, or raw text if the response is not JSON.
+
+        Raises:
+            APIError: If the request fails or the server returns an error status.
+        """
+        request_params: dict[str, Any] = {**self._base_params, "Action": action, **(params or {})}
+
+        logger.debug("Making async %s request for action=%s", method, action)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if method == "POST":
+                    response = await client.post(self.base_url, data=request_params)
+                else:
+                    response = await client.get(self.base_url, params=request_params)
+            except httpx.TransportError as exc:
+                # A POST is only resent when it cannot have reached the server.
+                retryable = method != "POST" or isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not retryable or attempt == self.max_retries:
+                    raise APIError(f"Request failed for action {action}: {_redact(str(exc))}") from exc
+                delay = _backoff_delay(attempt + 1, self.backoff_base, self.backoff_max, self.backoff_jitter)
+            except httpx.HTTPError as exc:
+                raise APIError(f"Request failed for action {action}: {_redact(str(exc))}") from exc
+            else:
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"), self.backoff_max)
+                if attempt == self.max_retries or not _is_retryable_status(
+                    method, response.status_code, retry_after is not None
+                ):
+                    break
+                if retry_after is None:
+                    delay = _backoff_delay(attempt + 1, self.backoff_base, self.backoff_max, self.backoff_jitter)
+                else:
+                    delay = retry_after
+            logger.debug("Retrying action=%s in %.2fs (retry %d of %d)", action, delay, attempt + 1, self.max_retries)
+            await asyncio.sleep(delay)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            raise APIError(
+                f"HTTP {status} for action {action}",
+                status_code=status,
+                response_body=exc.response.text[:_DEBUG_BODY_LIMIT],
+            ) from exc
+
+        logger.debug("status=%d bytes=%d", response.status_code, len(response.content))
+        if self.debug_bodies:
+            logger.debug("body=%r", response.content[:_DEBUG_BODY_LIMIT])
+
+        return _parse_body(action, response)
+
+    async def _get_tickets(self, client: httpx.AsyncClient, ticket_ids: Iterable[str]) -> list[APIResponse]:
+        """Fetch tickets concurrently through *client*, bounded by ``max_concurrency``."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(ticket_id: str) -> APIResponse:
+            async with semaphore:
+                response = await self._request(client, "GetTicket", params={"TicketID": ticket_id})
+            return _process_ticket(response, self.strict_html)
+
+        return list(await asyncio.gather(*(fetch(ticket_id) for ticket_id in ticket_ids)))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get_ticket(self, ticket_id: str) -> APIResponse:
+        """Retrieve details of a specific ticket.
+
+        HTML in the ``Description`` field is automatically converted to plain text.
+
+        Args:
+            ticket_id: The unique identifier of the ticket.
+
+        Returns:
+            Ticket information dict.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        response = await self._request(self.client, "GetTicket", params={"TicketID": ticket_id})
+        return _process_ticket(response, self.strict_html)
+
+    async def get_tickets_bulk(self, ticket_ids: Iterable[str]) -> list[APIResponse]:
+        """Retrieve several tickets concurrently.
+
+        Args:
+            ticket_ids: Identifiers of the tickets to fetch.
+
+        Returns:
+            Ticket information dicts, in the same order as ``ticket_ids``.
+
+        Raises:
+            APIError: If any of the requests fails.
+
+        Example::
+
+            tickets = await api.get_tickets_bulk(["100", "101", "102"])
+        """
+        return await self._get_tickets(self.client, ticket_ids)
+
+    def get_tickets_bulk_sync(self, ticket_ids: Iterable[str]) -> list[APIResponse]:
+        """Synchronous wrapper around :meth:`get_tickets_bulk`.
+
+        Runs the bulk fetch in a new event loop with a short-lived client, so it
+        must not be called from inside a running event loop.
+
+        Args:
+            ticket_ids: Identifiers of the tickets to fetch.
+
+        Returns:
+            Ticket information dicts, in the same order as ``ticket_ids``.
+
+        Raises:
+            APIError: If any of the requests fails.
+        """
+
+        async def run() -> list[APIResponse]:
+            async with self._new_client() as client:
+                return await self._get_tickets(client, ticket_ids)
+
+        return asyncio.run(run())
+
+    async def add_note(
+        self,
+        ticket_id: str,
+        text: str,
+        email: str,
+        note_type: str = "Public",
+    ) -> APIResponse:
+        """Add a note to an existing ticket.
+
+        Args:
+            ticket_id: The unique identifier of the ticket.
+            text: The note content.
+            email: Email address of the note author.
+            note_type: ``"Public"`` (visible to requester) or ``"Internal"``.
+
+        Returns:
+            API response confirming note addition.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        params = {
+            "TicketID": ticket_id,
+            "Text": text,
+            "Email": email,
+            "Type": note_type,
+        }
+        response = await self._request(self.client, "AddNote", method="POST", params=params)
+        if isinstance(response, str):
+            raise APIError(f"Unexpected non-JSON response: {response}")
+        return response
+
+
+class NoteBatcher:
+    """Collect notes submitted from many tasks and post them in concurrent batches.
+
+    Submitted notes are queued and flushed once ``max_batch_size`` notes are
+    waiting or ``max_queue_time`` seconds have passed since the first one
+    arrived. Batches are posted in the background through the API's shared
+    client, with at most ``max_concurrency`` ``AddNote`` requests in flight
+    across all batches. If the batcher stops unexpectedly (for example its
+    task is cancelled), futures of unposted notes fail with ``RuntimeError``.
+
+    Args:
+        api: The async client used to post notes.
+        max_batch_size: Maximum number of notes posted per batch.
+        max_queue_time: Maximum seconds a note waits before its batch is flushed.
+        max_concurrency: Maximum number of ``AddNote`` requests in flight.
+
+    Example::
+
+        async with AsyncHelpdeskAPI(base_url=..., api_key=...) as api, NoteBatcher(api) as batcher:
+            futures = [
+                await batcher.submit_note(ticket_id, "Patched", "agent@example.com")
+                for ticket_id in ticket_ids
+            ]
+            results = await asyncio.gather(*futures)
+    """
+
+    def __init__(
+        self,
+        api: AsyncHelpdeskAPI,
+        max_batch_size: int = 25,
+        max_queue_time: float = 0.2,
+        max_concurrency: int = 10,
+    ) -> None:
+        self.api = api
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self.max_concurrency = max_concurrency
+
+        self._queue: asyncio.Queue[_PendingNote | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._posting: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> NoteBatcher:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the background task that flushes queued notes."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush all queued notes and stop the background task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None and not self._task.done():
+            await self._queue.put(None)
+            await self._task
+
+    async def submit_note(
+        self,
+        ticket_id: str,
+        text: str,
+        email: str,
+        note_type: str = "Public",
+    ) -> asyncio.Future[APIResponse]:
+        """Queue a note for posting.
+
+        Args:
+            ticket_id: The unique identifier of the ticket.
+            text: The note content.
+            email: Email address of the note author.
+            note_type: ``"Public"`` (visible to requester) or ``"Internal"``.
+
+        Returns:
+            A future resolving to the ``AddNote`` response, or raising
+            :class:`APIError` if posting the note fails.
+
+        Raises:
+            RuntimeError: If the batcher has been closed or its background
+                task has stopped.
+        """
+        if self._closed or (self._task is not None and self._task.done()):
+            raise RuntimeError("Cannot submit notes to a closed NoteBatcher.")
+        self.start()
+
+        future: asyncio.Future[APIResponse] = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingNote(future, ticket_id, text, email, note_type))
+        return future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches until the close sentinel is seen.
+
+        Each batch is posted in its own task so collection of the next batch
+        starts immediately; the shared semaphore bounds requests across batches.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batch: list[_PendingNote] = []
+        stopping = False
+
+        try:
+            while not stopping:
+                first = await self._queue.get()
+                if first is None:
+                    break
+
+                batch = [first]
+                deadline = loop.time() + self.max_queue_time
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                logger.debug("Posting batch of %d notes", len(batch))
+                for note in batch:
+                    task = asyncio.create_task(self._post(note, semaphore))
+                    self._posting.add(task)
+                    task.add_done_callback(self._posting.discard)
+                batch = []
+
+            if self._posting:
+                await asyncio.gather(*self._posting)
+        except BaseException:
+            # Without this task nothing will ever post the queued notes, so
+            # fail their futures instead of leaving callers waiting forever.
+            self._closed = True
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None:
+                    batch.append(item)
+            for note in batch:
+                _fail_unposted(note)
+            raise
+
+    async def _post(self, note: _PendingNote, semaphore: asyncio.Semaphore) -> None:
+        """Post a single queued note and resolve its future."""
+        try:
+            async with semaphore:
+                result = await self.api.add_note(note.ticket_id, note.text, note.email, note.note_type)
+        except Exception as exc:
+            if not note.future.done():
+                note.future.set_exception(exc)
+            return
+        except BaseException:
+            _fail_unposted(note)
+            raise
+        if not note.future.done():
+            note.future.set_result(result)
+
+
+def _fail_unposted(note: _PendingNote) -> None:
+    """Fail the future of a note the batcher stopped before posting."""
+    if not note.future.done():
+        note.future.set_exception(RuntimeError("NoteBatcher stopped before the note was posted."))
+
+
+@dataclass(frozen=True)
+class _PendingNote:
+    """A note waiting in a :class:`NoteBatcher` queue."""
+
+    future: asyncio.Future[APIResponse]
+    ticket_id: str
+    text: str
+    email: str
+    note_type: str
@@ -0,0 +1,107 @@
+"""Circuit breaker guarding calls to the Lansweeper Helpdesk API."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from lansweeper_helpdesk.types import StrEnum
+
+
+class CircuitState(StrEnum):
+    """States of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling a failing backend until it has had time to recover.
+
+    The breaker starts ``CLOSED`` and lets every call through. It trips to
+    ``OPEN`` after ``failure_threshold`` consecutive failures, or when more than
+    ``failure_rate`` of the last ``window_size`` calls failed. While open, calls
+    are rejected without touching the network. After ``reset_timeout`` seconds
+    it moves to ``HALF_OPEN`` and admits a single probe: success closes the
+    circuit, failure opens it again.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to stay open before allowing a probe.
+        window_size: Number of recent calls used for the failure rate.
+        failure_rate: Failure ratio over a full window that opens the circuit.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        window_size: int = 20,
+        failure_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_rate = failure_rate
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._results: deque[bool] = deque(maxlen=window_size)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """The current circuit state."""
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed right now."""
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._results.clear()
+                self._probe_in_flight = False
+            self._consecutive_failures = 0
+            self._results.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if a threshold is crossed."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._results.append(False)
+            if self._state is CircuitState.HALF_OPEN or self._should_trip():
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def _should_trip(self) -> bool:
+        if self._consecutive_failures >= self.failure_threshold:
+            return True
+        if len(self._results) < (self._results.maxlen or 0):
+            return False
+        failures = self._results.count(False)
+        return failures / len(self._results) > self.failure_rate
@@ -2,19 +2,263 @@
 
 from __future__ import annotations
 
+import copy
+import html
+import importlib.util
 import json
 import logging
 import os
-from typing import Any
+import random
+import re
+import ssl
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from itertools import takewhile
+from typing import Any, Protocol
 
 import requests
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.retry import Retry
 
-from lansweeper_helpdesk.exceptions import APIError, ConfigurationError
+from lansweeper_helpdesk.circuit_breaker import CircuitBreaker
+from lansweeper_helpdesk.exceptions import APIError, CircuitOpenError, ConfigurationError
 from lansweeper_helpdesk.types import APIResponse
 
 logger = logging.getLogger(__name__)
 
+# Parse JSON straight from the response bytes, with orjson when it is installed.
+_json_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the optional "speedups" extra
+    _json_loads = json.loads
+
+# Fast path for HTML stripping: drop tags, then collapse whitespace.
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Prefer the C-based lxml parser for strict HTML stripping when it is installed.
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+# Note fields that may contain HTML.
+_NOTE_HTML_FIELDS = ("Text", "Note", "Body", "Description")
+
+# Maximum number of response bytes logged when ``debug_bodies`` is enabled,
+# and of error bodies kept on ``APIError``.
+_DEBUG_BODY_LIMIT = 2048
+
+# The API key travels in the query string, which urllib3 echoes in its errors.
+_API_KEY_RE = re.compile(r"(?<=[?&]Key=)[^&\s'\"]+")
+
+# Status codes that indicate a transient failure worth retrying.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# POSTs create tickets and notes, so a 5xx may mean the write was applied.
+# They are only retried when the server explicitly asks for it.
+_POST_RETRY_STATUSES = frozenset({429, 503})
+
+# Connection pool sizing for the shared session. ``pool_connections`` is the
+# number of per-host pools to keep, ``pool_maxsize`` the connections per pool.
+_POOL_CONNECTIONS = 20
+_POOL_MAXSIZE = 50
+
+# Maximum number of responses kept in the read cache.
+_CACHE_MAXSIZE = 1024
+
+# Cache key: the API action plus its sorted parameters.
+_CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+def _strip_html(markup: str, strict: bool = False) -> str:
+    """Convert an HTML string to plain text.
+
+    By default tags are removed with a regular expression and whitespace is
+    collapsed. With ``strict=True`` the markup is parsed with BeautifulSoup,
+    which also handles ``<script>``/``<style>`` blocks and malformed HTML.
+    """
+    if strict:
+        return BeautifulSoup(markup, _HTML_PARSER).get_text()
+
+    text = html.unescape(_TAG_RE.sub(" ", markup))
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _redact(text: str) -> str:
+    """Mask the API key in a URL or error message."""
+    return _API_KEY_RE.sub("***", text)
+
+
+def _backoff_delay(retry_number: int, base: float, maximum: float, jitter: float) -> float:
+    """Return the exponential backoff delay before the given (1-based) retry."""
+    if retry_number < 1:
+        return 0.0
+    delay = base * 2.0 ** (retry_number - 1) + random.random() * jitter
+    return min(maximum, delay)
+
+
+def _retry_after_seconds(value: str | None, maximum: float) -> float | None:
+    """Parse a ``Retry-After`` header into seconds, capped at ``maximum``.
+
+    Returns ``None`` when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), maximum)
+
+
+def _is_retryable_status(method: str, status_code: int, has_retry_after: bool) -> bool:
+    """Return whether a response with ``status_code`` should be retried."""
+    if method.upper() == "POST":
+        return has_retry_after and status_code in _POST_RETRY_STATUSES
+    return status_code in _RETRY_STATUSES
+
+
+class _HelpdeskRetry(Retry):
+    """urllib3 ``Retry`` with the client's backoff policy.
+
+    urllib3 retries the first failure immediately and sleeps for as long as
+    ``Retry-After`` asks. Here every retry, including the first, waits the
+    jittered exponential backoff, and ``Retry-After`` is capped at
+    ``backoff_max`` so a misbehaving server cannot block a call for hours.
+    POSTs are retried on connection errors and on ``429``/``503`` with a
+    ``Retry-After`` header only, so a write is never sent twice after the
+    server may have applied it.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        return _is_retryable_status(method, status_code, has_retry_after and self.respect_retry_after_header)
+
+    def get_backoff_time(self) -> float:
+        consecutive_errors = len(list(takewhile(lambda x: x.redirect_location is None, reversed(self.history))))
+        return _backoff_delay(consecutive_errors, self.backoff_factor, self.backoff_max, self.backoff_jitter)
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        return _retry_after_seconds(response.headers.get("Retry-After"), self.backoff_max)
+
+    def sleep_for_retry(self, response: BaseHTTPResponse) -> bool:
+        # urllib3 treats ``Retry-After: 0`` as absent and falls back to the
+        # backoff; like the async client, retry straight away instead.
+        retry_after = self.get_retry_after(response)
+        if retry_after is None:
+            return False
+        if retry_after > 0:
+            time.sleep(retry_after)
+        return True
+
+
+def _load_ssl_context(cert_path: str) -> ssl.SSLContext:
+    """Build an SSL context that trusts the CA bundle at ``cert_path``.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ConfigurationError: If the file is not a valid PEM certificate bundle.
+    """
+    if not os.path.isfile(cert_path):
+        raise FileNotFoundError(f"Certificate file not found: {cert_path}")
+    try:
+        return ssl.create_default_context(cafile=cert_path)
+    except ssl.SSLError as exc:
+        raise ConfigurationError(f"Invalid certificate file: {cert_path}") from exc
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that verifies TLS against a preloaded ``ssl.SSLContext``.
+
+    By default urllib3 re-reads the CA bundle on every new connection. When an
+    SSL context is given, the bundle is parsed once and every pooled
+    connection, direct or through a proxy, reuses the loaded context instead.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext | None = None, **kwargs: Any) -> None:
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        if self.ssl_context is not None:
+            proxy_kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def build_connection_pool_key_attributes(
+        self,
+        request: requests.PreparedRequest,
+        verify: bool | str,
+        cert: str | tuple[str, str] | None = None,
+    ) -> tuple[Any, Any]:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if self.ssl_context is not None:
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: bool | str, cert: str | tuple[str, str] | None) -> None:
+        super().cert_verify(conn, url, verify, cert)  # type: ignore[no-untyped-call]
+        if self.ssl_context is not None and verify is not False:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class _Response(Protocol):
+    """The parts of a ``requests``/``httpx`` response used for decoding."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+
+def _parse_body(action: str, response: _Response) -> APIResponse | str:
+    """Decode a successful response body as JSON, falling back to raw text.
+
+    The body is parsed from bytes first, as UTF-8 is by far the common case.
+    Otherwise it is decoded with the declared charset and parsed again, and
+    returned as text if it still is not JSON.
+    """
+    content = response.content
+    if not content:
+        raise APIError(f"Empty response for action {action}", status_code=response.status_code)
+
+    try:
+        return _json_loads(content)  # type: ignore[no-any-return]
+    except ValueError:
+        pass
+    text = response.text
+    try:
+        return json.loads(text)  # type: ignore[no-any-return]
+    except ValueError:
+        return text
+
+
+def _process_ticket(response: APIResponse | str, strict_html: bool = False) -> APIResponse:
+    """Validate a ``GetTicket`` response and strip HTML from its description."""
+    if isinstance(response, str):
+        raise APIError(f"Unexpected non-JSON response: {response}")
+
+    if "Description" in response:
+        response["Description"] = _strip_html(response["Description"], strict_html)
+    return response
+
 
 class HelpdeskAPI:
     """Client for the Lansweeper Helpdesk API.
@@ -27,10 +271,43 @@ class HelpdeskAPI:
             (e.g. ``"https://helpdesk.example.com:443/api.aspx"``).
         api_key: API key for authentication.
         cert_path: Optional path to an SSL certificate file for verification.
-            When ``None``, standard certificate verification is used.
+            When ``None``, standard certificate verification is used. The file is
+            loaded once into an SSL context shared by all pooled connections.
+        ssl_context: Optional preloaded ``ssl.SSLContext`` used to verify the
+            server, as an alternative to ``cert_path``.
+        max_retries: How many times a request is retried after a connection
+            error, a ``429`` or a ``5xx`` response. Writes (POST) are only
+            retried on connection errors and on ``429``/``503`` responses
+            carrying ``Retry-After``. ``0`` disables retries.
+        backoff_base: Delay in seconds before the first retry; it doubles for
+            each further retry.
+        backoff_max: Upper bound in seconds for a single backoff delay,
+            including delays requested by ``Retry-After``.
+        backoff_jitter: Maximum random delay in seconds added to each backoff,
+            so concurrent clients do not retry in lockstep.
+        timeout: Seconds to wait for the server, either a single value or a
+            ``(connect, read)`` tuple. Connect timeouts are retried for every
+            request, read timeouts for GETs only, since a write may already
+            have been applied. A timeout counts as a circuit breaker failure.
+        cache_ttl: Seconds to cache responses of ``get_ticket``, ``search_tickets``
+            and ``get_user``. ``0`` disables caching.
+        strict_html: Strip HTML with a full BeautifulSoup parse instead of the
+            default regular expression. Use it for content with ``<script>`` or
+            ``<style>`` blocks.
+        debug_bodies: Also log the first 2 KB of each response body at
+            ``DEBUG`` level. Bodies may contain personal data, so this is off
+            by default.
+
+    Requests share a pooled keep-alive session; retries are handled by
+    urllib3 and honour ``Retry-After`` headers. Cached entries touching a ticket
+    are invalidated when that ticket is edited or receives a note. If the server
+    keeps failing, a circuit breaker rejects calls with :class:`CircuitOpenError`
+    for 30 seconds before letting a single probe request through.
 
     Raises:
-        ConfigurationError: If ``base_url`` or ``api_key`` is not provided.
+        ConfigurationError: If ``base_url`` or ``api_key`` is not provided, if
+            ``cert_path`` is not a valid certificate file, or if both
+            ``cert_path`` and ``ssl_context`` are given.
         FileNotFoundError: If ``cert_path`` is given but the file does not exist.
 
     Example::
@@ -50,22 +327,73 @@ class HelpdeskAPI:
         base_url: str,
         api_key: str,
         cert_path: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        backoff_jitter: float = 0.5,
+        timeout: float | tuple[float, float] = (10.0, 60.0),
+        cache_ttl: float = 60.0,
+        strict_html: bool = False,
+        debug_bodies: bool = False,
     ) -> None:
         if not base_url:
             raise ConfigurationError("base_url must be provided.")
         if not api_key:
             raise ConfigurationError("api_key must be provided.")
+        if cert_path is not None and ssl_context is not None:
+            raise ConfigurationError("Pass either cert_path or ssl_context, not both.")
+        if cert_path is not None:
+            ssl_context = _load_ssl_context(cert_path)
 
         self.base_url = base_url
-        self.api_key = api_key
+        self.timeout = timeout
+        self.strict_html = strict_html
+        self.debug_bodies = debug_bodies
+        self._base_params: dict[str, str] = {"Key": api_key}
+
+        self._cache: TTLCache[_CacheKey, APIResponse | str] | None = (
+            TTLCache(maxsize=_CACHE_MAXSIZE, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+        self._cache_lock = threading.Lock()
+
+        self._breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
 
         self.session = requests.Session()
+        retry = _HelpdeskRetry(
+            total=max_retries,
+            backoff_factor=backoff_base,
+            backoff_max=backoff_max,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = _SSLContextAdapter(
+            ssl_context=ssl_context,
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         if cert_path is not None:
-            if not os.path.isfile(cert_path):
-                raise FileNotFoundError(f"Certificate file not found: {cert_path}")
             self.session.verify = cert_path
 
+    @property
+    def api_key(self) -> str:
+        """API key sent with every request."""
+        return self._base_params["Key"]
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._base_params = {"Key": value}
+        # Cache keys do not include the API key, so results fetched with the
+        # old key must not be served under the new one.
+        self.clear_cache()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -89,49 +417,94 @@ class HelpdeskAPI:
             Parsed JSON response as a dict, or raw text if the response is not JSON.
 
         Raises:
+            CircuitOpenError: If recent failures opened the circuit breaker.
             APIError: If the request fails or the server returns an error status.
         """
-        request_params: dict[str, Any] = {
-            "Action": action,
-            "Key": self.api_key,
-            **(params or {}),
-        }
+        request_params: dict[str, Any] = {**self._base_params, "Action": action, **(params or {})}
+
+        if not self._breaker.allow():
+            raise CircuitOpenError(f"Circuit open, not sending action {action}")
 
         logger.debug("Making %s request for action=%s", method, action)
 
         try:
             if method == "POST":
-                response = self.session.post(self.base_url, data=request_params, files=files)
+                response = self.session.post(self.base_url, data=request_params, files=files, timeout=self.timeout)
             else:
-                response = self.session.get(self.base_url, params=request_params)
+                response = self.session.get(self.base_url, params=request_params, timeout=self.timeout)
 
             response.raise_for_status()
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response is not None else None
-            body = exc.response.text if exc.response is not None else None
+            body = exc.response.text[:_DEBUG_BODY_LIMIT] if exc.response is not None else None
+            if status is None or status == 429 or status >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
             raise APIError(f"HTTP {status} for action {action}", status_code=status, response_body=body) from exc
         except requests.RequestException as exc:
-            raise APIError(f"Request failed for action {action}: {exc}") from exc
-
-        logger.debug("Response status: %s", response.status_code)
-
-        if not response.text:
-            raise APIError(f"Empty response for action {action}", status_code=response.status_code)
+            self._breaker.record_failure()
+            raise APIError(f"Request failed for action {action}: {_redact(str(exc))}") from exc
+        except BaseException:
+            # Anything else (e.g. KeyboardInterrupt) must still settle the call,
+            # or a half-open probe would block the circuit forever.
+            self._breaker.record_failure()
+            raise
+
+        self._breaker.record_success()
+        logger.debug("status=%d bytes=%d", response.status_code, len(response.content))
+        if self.debug_bodies:
+            logger.debug("body=%r", response.content[:_DEBUG_BODY_LIMIT])
+
+        return _parse_body(action, response)
+
+    def _cached_get(self, action: str, params: dict[str, Any]) -> APIResponse | str:
+        """Make a GET request, serving repeated calls from the read cache.
+
+        Only JSON object responses are cached; error text is always refetched.
+        Callers receive a private copy of the response, so in-place
+        post-processing never alters the cached entry.
+        """
+        if self._cache is None:
+            return self._request(action, params=params)
+
+        key: _CacheKey = (action, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug("Cache hit for action=%s", action)
+            return copy.deepcopy(cached)
+
+        response = self._request(action, params=params)
+        if isinstance(response, dict):
+            with self._cache_lock:
+                self._cache[key] = copy.deepcopy(response)
+        return response
 
-        try:
-            return response.json()  # type: ignore[no-any-return]
-        except json.JSONDecodeError:
-            return response.text
+    def _invalidate_cache(self, ticket_id: str | None = None) -> None:
+        """Drop cached searches and, if given, every entry for ``ticket_id``."""
+        if self._cache is None:
+            return
 
-    @staticmethod
-    def _strip_html(html: str) -> str:
-        """Convert an HTML string to plain text."""
-        return BeautifulSoup(html, "html.parser").get_text()
+        with self._cache_lock:
+            stale = [
+                key
+                for key in self._cache
+                if key[0] == "SearchTickets" or (ticket_id is not None and ("TicketID", ticket_id) in key[1])
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def clear_cache(self) -> None:
+        """Discard all cached responses."""
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.clear()
+
     def create_ticket(self, subject: str, description: str, email: str) -> APIResponse:
         """Create a new helpdesk ticket.
 
@@ -159,7 +532,11 @@ class HelpdeskAPI:
             "Description": description,
             "Email": email,
         }
-        response = self._request("AddTicket", method="POST", params=params)
+        try:
+            response = self._request("AddTicket", method="POST", params=params)
+        finally:
+            # A failed write may still have been applied by the server.
+            self._invalidate_cache()
         if isinstance(response, str):
             raise APIError(f"Unexpected non-JSON response: {response}")
         return response
@@ -183,13 +560,8 @@ class HelpdeskAPI:
             ticket = api.get_ticket("12345")
             print(ticket["Description"])
         """
-        response = self._request("GetTicket", params={"TicketID": ticket_id})
-        if isinstance(response, str):
-            raise APIError(f"Unexpected non-JSON response: {response}")
-
-        if "Description" in response:
-            response["Description"] = self._strip_html(response["Description"])
-        return response
+        response = self._cached_get("GetTicket", {"TicketID": ticket_id})
+        return _process_ticket(response, self.strict_html)
 
     def get_ticket_history(self, ticket_id: str) -> list[APIResponse]:
         """Retrieve the complete history of a ticket including all notes.
@@ -213,9 +585,10 @@ class HelpdeskAPI:
 
         # Strip HTML from text fields inside each note
         for note in notes:
-            for key in ("Text", "Description"):
-                if key in note and isinstance(note[key], str):
-                    note[key] = self._strip_html(note[key])
+            for key in _NOTE_HTML_FIELDS:
+                value = note.get(key)
+                if value and isinstance(value, str):
+                    note[key] = _strip_html(value, self.strict_html)
 
         return notes
 
@@ -255,7 +628,10 @@ class HelpdeskAPI:
             "Email": email,
             "Type": note_type,
         }
-        response = self._request("AddNote", method="POST", params=params)
+        try:
+            response = self._request("AddNote", method="POST", params=params)
+        finally:
+            self._invalidate_cache(ticket_id)
         if isinstance(response, str):
             raise APIError(f"Unexpected non-JSON response: {response}")
         return response
@@ -315,7 +691,7 @@ class HelpdeskAPI:
             "MaxDate": max_date,
         }
         params = {k: v for k, v in param_map.items() if v is not None}
-        response = self._request("SearchTickets", params=params)
+        response = self._cached_get("SearchTickets", params)
         if isinstance(response, str):
             raise APIError(f"Unexpected non-JSON response: {response}")
         return response
@@ -336,7 +712,7 @@ class HelpdeskAPI:
 
             user = api.get_user("user@example.com")
         """
-        response = self._request("SearchUsers", params={"Email": email})
+        response = self._cached_get("SearchUsers", {"Email": email})
         if isinstance(response, str):
             raise APIError(f"Unexpected non-JSON response: {response}")
         return response
@@ -377,7 +753,10 @@ class HelpdeskAPI:
             "Type": ticket_type,
             "Email": email,
         }
-        response = self._request("EditTicket", method="POST", params=params)
+        try:
+            response = self._request("EditTicket", method="POST", params=params)
+        finally:
+            self._invalidate_cache(ticket_id)
         if isinstance(response, str):
             raise APIError(f"Unexpected non-JSON response: {response}")
         return response
@@ -32,3 +32,7 @@ class APIError(HelpdeskError):
 
 class TicketNotFoundError(APIError):
     """Raised when a requested ticket does not exist."""
+
+
+class CircuitOpenError(APIError):
+    """Raised when a call is rejected because the circuit breaker is open."""
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import socket
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import certifi
 import pytest
 
 from lansweeper_helpdesk import HelpdeskAPI
@@ -11,8 +16,16 @@ from lansweeper_helpdesk import HelpdeskAPI
 
 @pytest.fixture()
 def cert_file(tmp_path: Path) -> str:
-    """Create a temporary dummy certificate file and return its path."""
+    """Create a temporary CA bundle file and return its path."""
     cert = tmp_path / "cert.pem"
+    cert.write_text(Path(certifi.where()).read_text())
+    return str(cert)
+
+
+@pytest.fixture()
+def invalid_cert_file(tmp_path: Path) -> str:
+    """Create a temporary file that is not a valid certificate and return its path."""
+    cert = tmp_path / "invalid.pem"
     cert.write_text("dummy-cert-content")
     return str(cert)
 
@@ -34,3 +47,63 @@ def api_no_cert() -> HelpdeskAPI:
         base_url="https://helpdesk.example.com/api.aspx",
         api_key="test-api-key",
     )
+
+
+@pytest.fixture()
+def retry_sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record the delays urllib3 sleeps for between retries instead of sleeping."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture()
+def closed_port_url() -> str:
+    """Return a local URL on which nothing is listening."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/api.aspx"
+
+
+class ScriptedServer:
+    """Local HTTP server replying with queued ``(status, headers, body)`` tuples."""
+
+    def __init__(self) -> None:
+        self.replies: list[tuple[int, dict[str, str], bytes]] = []
+        self.methods: list[str] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self) -> None:
+                server.methods.append(self.command)
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                status, headers, body = server.replies.pop(0)
+                self.send_response(status)
+                for name, value in {"Content-Length": str(len(body)), **headers}.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _reply  # noqa: N815
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/api.aspx"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture()
+def scripted_server() -> Iterator[ScriptedServer]:
+    """Run a :class:`ScriptedServer` for the duration of a test."""
+    server = ScriptedServer()
+    yield server
+    server.close()
@@ -0,0 +1,328 @@
+"""Tests for the AsyncHelpdeskAPI client."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from lansweeper_helpdesk.async_client import AsyncHelpdeskAPI, NoteBatcher  # noqa: E402
+from lansweeper_helpdesk.exceptions import APIError, ConfigurationError  # noqa: E402
+
+BASE_URL = "https://helpdesk.example.com/api.aspx"
+
+
+def ticket_handler(request: httpx.Request) -> httpx.Response:
+    ticket_id = request.url.params["TicketID"]
+    if ticket_id == "missing":
+        return httpx.Response(404, text="Not Found")
+    return httpx.Response(200, json={"TicketID": ticket_id, "Description": f"<p>Ticket <b>{ticket_id}</b></p>"})
+
+
+def make_api(**kwargs: object) -> AsyncHelpdeskAPI:
+    return AsyncHelpdeskAPI(
+        base_url=BASE_URL,
+        api_key="test-api-key",
+        transport=httpx.MockTransport(ticket_handler),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestInit:
+    def test_missing_base_url(self) -> None:
+        with pytest.raises(ConfigurationError, match="base_url"):
+            AsyncHelpdeskAPI(base_url="", api_key="key")
+
+    def test_missing_api_key(self) -> None:
+        with pytest.raises(ConfigurationError, match="api_key"):
+            AsyncHelpdeskAPI(base_url=BASE_URL, api_key="")
+
+    def test_bad_cert_path(self) -> None:
+        with pytest.raises(FileNotFoundError, match="does-not-exist"):
+            AsyncHelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path="/does-not-exist.pem")
+
+    def test_invalid_cert_file(self, invalid_cert_file: str) -> None:
+        with pytest.raises(ConfigurationError, match="Invalid certificate"):
+            AsyncHelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=invalid_cert_file)
+
+    def test_cert_path_and_ssl_context_are_exclusive(self, cert_file: str) -> None:
+        with pytest.raises(ConfigurationError, match="not both"):
+            AsyncHelpdeskAPI(
+                base_url=BASE_URL, api_key="key", cert_path=cert_file, ssl_context=ssl.create_default_context()
+            )
+
+
+class TestTimeout:
+    def test_default_matches_sync_client(self) -> None:
+        timeout = make_api().client.timeout
+        assert timeout.connect == 10.0
+        assert timeout.read == 60.0
+
+    def test_single_value(self) -> None:
+        timeout = make_api(timeout=5.0).client.timeout
+        assert timeout.connect == timeout.read == 5.0
+
+
+class TestGetTicket:
+    def test_success_strips_html(self) -> None:
+        async def run() -> dict[str, object]:
+            async with make_api() as api:
+                return await api.get_ticket("100")
+
+        result = asyncio.run(run())
+        assert result == {"TicketID": "100", "Description": "Ticket 100"}
+
+    def test_http_error_includes_status(self) -> None:
+        async def run() -> None:
+            async with make_api() as api:
+                await api.get_ticket("missing")
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 404
+
+
+class TestGetTicketsBulk:
+    def test_preserves_order(self) -> None:
+        async def run() -> list[dict[str, object]]:
+            async with make_api() as api:
+                return await api.get_tickets_bulk(["3", "1", "2"])
+
+        results = asyncio.run(run())
+        assert [r["TicketID"] for r in results] == ["3", "1", "2"]
+        assert results[0]["Description"] == "Ticket 3"
+
+    def test_bounded_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"TicketID": request.url.params["TicketID"]})
+
+        async def run() -> list[dict[str, object]]:
+            async with AsyncHelpdeskAPI(
+                base_url=BASE_URL,
+                api_key="key",
+                max_concurrency=3,
+                transport=httpx.MockTransport(handler),
+            ) as api:
+                return await api.get_tickets_bulk([str(i) for i in range(10)])
+
+        results = asyncio.run(run())
+        assert len(results) == 10
+        assert peak == 3
+
+    def test_error_propagates(self) -> None:
+        async def run() -> None:
+            async with make_api() as api:
+                await api.get_tickets_bulk(["1", "missing"])
+
+        with pytest.raises(APIError):
+            asyncio.run(run())
+
+    def test_sync_wrapper(self) -> None:
+        results = make_api().get_tickets_bulk_sync(["1", "2"])
+        assert [r["TicketID"] for r in results] == ["1", "2"]
+
+
+class TestAddNote:
+    def test_posts_form_data(self) -> None:
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"Result": "Success"})
+
+        async def run() -> dict[str, object]:
+            async with AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(handler)) as api:
+                return await api.add_note("100", "A note", "a@b.com")
+
+        assert asyncio.run(run()) == {"Result": "Success"}
+        assert b"Action=AddNote" in bodies[0]
+        assert b"Type=Public" in bodies[0]
+
+
+class TestRetries:
+    @staticmethod
+    def run_with(
+        replies: list[httpx.Response | Exception], method: str = "GET", **kwargs: object
+    ) -> tuple[object, int]:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            reply = replies[min(calls, len(replies) - 1)]
+            calls += 1
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        async def run() -> object:
+            async with AsyncHelpdeskAPI(
+                BASE_URL,
+                "key",
+                backoff_base=0,
+                backoff_jitter=0,
+                transport=httpx.MockTransport(handler),
+                **kwargs,  # type: ignore[arg-type]
+            ) as api:
+                if method == "POST":
+                    return await api.add_note("100", "A note", "a@b.com")
+                return await api.get_ticket("100")
+
+        try:
+            result: object = asyncio.run(run())
+        except APIError as exc:
+            result = exc
+        return result, calls
+
+    def test_retries_server_error_then_succeeds(self) -> None:
+        result, calls = self.run_with([httpx.Response(503), httpx.Response(200, json={"TicketID": "100"})])
+        assert result == {"TicketID": "100"}
+        assert calls == 2
+
+    def test_retries_connection_errors(self) -> None:
+        error = httpx.ConnectError("refused")
+        result, calls = self.run_with([error, error, httpx.Response(200, json={"Result": "Success"})], "POST")
+        assert result == {"Result": "Success"}
+        assert calls == 3
+
+    def test_gives_up_after_max_retries(self) -> None:
+        result, calls = self.run_with([httpx.Response(502)])
+        assert isinstance(result, APIError)
+        assert result.status_code == 502
+        assert calls == 4
+
+    def test_retries_disabled(self) -> None:
+        result, calls = self.run_with([httpx.Response(503)], max_retries=0)
+        assert isinstance(result, APIError)
+        assert calls == 1
+
+    @pytest.mark.parametrize("reply", [httpx.Response(500), httpx.Response(429), httpx.ReadTimeout("slow")])
+    def test_post_is_not_retried_after_it_may_have_been_applied(self, reply: httpx.Response | Exception) -> None:
+        result, calls = self.run_with([reply, httpx.Response(200, json={"Result": "Success"})], "POST")
+        assert isinstance(result, APIError)
+        assert calls == 1
+
+    def test_retry_after_is_capped_at_backoff_max(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("lansweeper_helpdesk.async_client.asyncio.sleep", fake_sleep)
+        result, calls = self.run_with(
+            [httpx.Response(429, headers={"Retry-After": "3600"}), httpx.Response(200, json={"Result": "Success"})],
+            "POST",
+            backoff_max=5,
+        )
+        assert result == {"Result": "Success"}
+        assert sleeps == [5.0]
+
+
+class TestNoteBatcher:
+    @staticmethod
+    def note_handler(request: httpx.Request) -> httpx.Response:
+        form = dict(item.split("=", 1) for item in request.content.decode().split("&"))
+        if form["TicketID"] == "bad":
+            return httpx.Response(500, text="Internal Server Error")
+        return httpx.Response(200, json={"TicketID": form["TicketID"], "Result": "Success"})
+
+    def test_resolves_futures_in_batches(self) -> None:
+        async def run() -> list[dict[str, object]]:
+            async with (
+                AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(self.note_handler)) as api,
+                NoteBatcher(api, max_batch_size=2, max_queue_time=0.01) as batcher,
+            ):
+                futures = [await batcher.submit_note(str(i), "text", "a@b.com") for i in range(5)]
+                return list(await asyncio.gather(*futures))
+
+        results = asyncio.run(run())
+        assert [r["TicketID"] for r in results] == ["0", "1", "2", "3", "4"]
+
+    def test_failed_note_sets_exception(self) -> None:
+        async def run() -> tuple[object, object]:
+            async with (
+                AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(self.note_handler)) as api,
+                NoteBatcher(api) as batcher,
+            ):
+                good = await batcher.submit_note("1", "text", "a@b.com")
+                bad = await batcher.submit_note("bad", "text", "a@b.com")
+                return tuple(await asyncio.gather(good, bad, return_exceptions=True))  # type: ignore[return-value]
+
+        good, bad = asyncio.run(run())
+        assert good == {"TicketID": "1", "Result": "Success"}
+        assert isinstance(bad, APIError)
+        assert bad.status_code == 500
+
+    def test_close_flushes_pending_notes(self) -> None:
+        async def run() -> asyncio.Future[dict[str, object]]:
+            async with AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(self.note_handler)) as api:
+                batcher = NoteBatcher(api, max_queue_time=60)
+                future = await batcher.submit_note("7", "text", "a@b.com")
+                await batcher.close()
+                return future
+
+        future = asyncio.run(run())
+        assert future.result()["TicketID"] == "7"
+
+    def test_submit_after_close_raises(self) -> None:
+        async def run() -> None:
+            async with AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(self.note_handler)) as api:
+                batcher = NoteBatcher(api)
+                await batcher.close()
+                await batcher.submit_note("1", "text", "a@b.com")
+
+        with pytest.raises(RuntimeError, match="closed"):
+            asyncio.run(run())
+
+    def test_slow_batch_does_not_hold_up_the_next(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            form = dict(item.split("=", 1) for item in request.content.decode().split("&"))
+            if form["TicketID"] == "slow":
+                await release.wait()
+            return httpx.Response(200, json={"TicketID": form["TicketID"]})
+
+        async def run() -> dict[str, object]:
+            async with (
+                AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(handler)) as api,
+                NoteBatcher(api, max_batch_size=1) as batcher,
+            ):
+                slow = await batcher.submit_note("slow", "text", "a@b.com")
+                fast = await batcher.submit_note("fast", "text", "a@b.com")
+                result = await asyncio.wait_for(fast, timeout=5)
+                assert not slow.done()
+                release.set()
+                await slow
+                return result
+
+        assert asyncio.run(run()) == {"TicketID": "fast"}
+
+    def test_stopped_batcher_fails_pending_notes(self) -> None:
+        async def run() -> asyncio.Future[dict[str, object]]:
+            async with AsyncHelpdeskAPI(BASE_URL, "key", transport=httpx.MockTransport(self.note_handler)) as api:
+                batcher = NoteBatcher(api, max_queue_time=60)
+                future = await batcher.submit_note("1", "text", "a@b.com")
+                await asyncio.sleep(0)
+                assert batcher._task is not None
+                batcher._task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await batcher._task
+                with pytest.raises(RuntimeError, match="closed"):
+                    await batcher.submit_note("2", "text", "a@b.com")
+                await batcher.close()
+                return future
+
+        future = asyncio.run(run())
+        with pytest.raises(RuntimeError, match="stopped before the note was posted"):
+            future.result()
@@ -0,0 +1,81 @@
+"""Tests for the circuit breaker."""
+
+from __future__ import annotations
+
+from lansweeper_helpdesk.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=3, reset_timeout=10, window_size=4, failure_rate=0.5, clock=clock)
+
+
+class TestCircuitBreaker:
+    def test_starts_closed(self) -> None:
+        breaker = make_breaker(FakeClock())
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        breaker = make_breaker(FakeClock())
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_consecutive_failures(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=3, window_size=20, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_on_failure_rate_over_full_window(self) -> None:
+        breaker = make_breaker(FakeClock())
+        for ok in (False, True, False, False):
+            if ok:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_admits_single_probe(self) -> None:
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_successful_probe_closes(self) -> None:
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        clock.now = 15
+        assert not breaker.allow()
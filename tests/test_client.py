@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import logging
+import ssl
+
 import pytest
+import requests
 import responses
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
 
 from lansweeper_helpdesk import HelpdeskAPI
-from lansweeper_helpdesk.exceptions import APIError, ConfigurationError
+from lansweeper_helpdesk.circuit_breaker import CircuitBreaker
+from lansweeper_helpdesk.client import _SSLContextAdapter
+from lansweeper_helpdesk.exceptions import APIError, CircuitOpenError, ConfigurationError
+from tests.conftest import ScriptedServer
 
 BASE_URL = "https://helpdesk.example.com/api.aspx"
 
@@ -36,6 +45,51 @@ class TestInit:
     def test_cert_path_set(self, api: HelpdeskAPI, cert_file: str) -> None:
         assert api.session.verify == cert_file
 
+    def test_cert_path_loaded_into_ssl_context(self, api: HelpdeskAPI) -> None:
+        adapter = api.session.get_adapter(BASE_URL)
+        assert isinstance(adapter, _SSLContextAdapter)
+        assert isinstance(adapter.ssl_context, ssl.SSLContext)
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is adapter.ssl_context
+
+    def test_pool_key_skips_ca_bundle_reload(self, api: HelpdeskAPI, cert_file: str) -> None:
+        adapter = api.session.get_adapter(BASE_URL)
+        request = requests.Request("GET", BASE_URL).prepare()
+        _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, cert_file)
+        assert "ca_certs" not in pool_kwargs
+
+    @pytest.mark.parametrize("from_env", [False, True])
+    def test_ssl_context_used_through_proxy(
+        self, api: HelpdeskAPI, monkeypatch: pytest.MonkeyPatch, from_env: bool
+    ) -> None:
+        proxies = {"https": "http://proxy.example:3128"}
+        if from_env:
+            monkeypatch.setenv("HTTPS_PROXY", proxies["https"])
+            proxies = {}
+        settings = api.session.merge_environment_settings(BASE_URL, proxies, None, None, None)
+        assert settings["proxies"]["https"] == "http://proxy.example:3128"
+
+        adapter = api.session.get_adapter(BASE_URL)
+        assert isinstance(adapter, _SSLContextAdapter)
+        request = requests.Request("GET", BASE_URL).prepare()
+        conn = adapter.get_connection_with_tls_context(request, settings["verify"], proxies=settings["proxies"])
+        adapter.cert_verify(conn, BASE_URL, settings["verify"], None)
+        assert conn.conn_kw["ssl_context"] is adapter.ssl_context
+        assert conn.ca_certs is None
+
+    def test_invalid_cert_file(self, invalid_cert_file: str) -> None:
+        with pytest.raises(ConfigurationError, match="Invalid certificate"):
+            HelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=invalid_cert_file)
+
+    def test_preloaded_ssl_context(self) -> None:
+        context = ssl.create_default_context()
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", ssl_context=context)
+        assert api.session.get_adapter(BASE_URL).ssl_context is context  # type: ignore[attr-defined]
+        assert api.session.verify is True
+
+    def test_cert_path_and_ssl_context_are_exclusive(self, cert_file: str) -> None:
+        with pytest.raises(ConfigurationError, match="not both"):
+            HelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=cert_file, ssl_context=ssl.create_default_context())
+
 
 # ------------------------------------------------------------------
 # create_ticket
@@ -78,6 +132,28 @@ class TestGetTicket:
         result = api.get_ticket("100")
         assert result["Description"] == "Hello world"
 
+    @responses.activate
+    def test_unescapes_entities_and_collapses_whitespace(self, api: HelpdeskAPI) -> None:
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            json={"TicketID": "100", "Description": "<div>\n  Tom &amp; Jerry<br/>\n\n <p>say&nbsp;hi</p></div>"},
+            status=200,
+        )
+        result = api.get_ticket("100")
+        assert result["Description"] == "Tom & Jerry say hi"
+
+    @responses.activate
+    def test_strict_html_drops_script_blocks(self) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", strict_html=True)
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            json={"TicketID": "100", "Description": "<p>Hello</p><script>alert(1)</script>"},
+            status=200,
+        )
+        assert api.get_ticket("100")["Description"] == "Hello"
+
     @responses.activate
     def test_no_description_key(self, api: HelpdeskAPI) -> None:
         responses.add(
@@ -114,6 +190,17 @@ class TestGetTicketHistory:
         assert notes[0]["Text"] == "Note one"
         assert notes[1]["Text"] == "Note two"
 
+    @responses.activate
+    def test_strips_html_from_all_text_fields(self, api: HelpdeskAPI) -> None:
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            json={"Notes": [{"Note": "<i>a</i>", "Body": "<p>b</p>", "Text": None, "NoteID": 7}]},
+            status=200,
+        )
+        notes = api.get_ticket_history("100")
+        assert notes == [{"Note": "a", "Body": "b", "Text": None, "NoteID": 7}]
+
     @responses.activate
     def test_empty_notes(self, api: HelpdeskAPI) -> None:
         responses.add(responses.GET, BASE_URL, json={"Notes": []}, status=200)
@@ -212,6 +299,34 @@ class TestEditTicket:
 
 
 class TestRequest:
+    def test_connection_error_does_not_leak_api_key(self, closed_port_url: str, retry_sleeps: list[float]) -> None:
+        api = HelpdeskAPI(base_url=closed_port_url, api_key="SECRET-KEY", max_retries=0)
+        with pytest.raises(APIError) as exc_info:
+            api.get_ticket("1")
+        assert "Key=***" in str(exc_info.value)
+        assert "SECRET-KEY" not in str(exc_info.value)
+
+    @responses.activate
+    def test_error_body_is_truncated(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, body="x" * 5000, status=404)
+        with pytest.raises(APIError) as exc_info:
+            api.get_ticket("100")
+        assert exc_info.value.response_body == "x" * 2048
+
+    @responses.activate
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    def test_sends_timeout(self, cert_file: str, method: str) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=cert_file, timeout=(3.0, 7.0))
+        responses.add(method, BASE_URL, json={"Result": "Success"}, status=200)
+        api._request("Ping", method=method)
+        assert responses.calls[0].request.req_kwargs["timeout"] == (3.0, 7.0)
+
+    @responses.activate
+    def test_default_timeout(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"Result": "Success"}, status=200)
+        api._request("Ping")
+        assert responses.calls[0].request.req_kwargs["timeout"] == (10.0, 60.0)
+
     @responses.activate
     def test_empty_response_raises(self, api: HelpdeskAPI) -> None:
         responses.add(responses.GET, BASE_URL, body="", status=200)
@@ -231,3 +346,350 @@ class TestRequest:
         with pytest.raises(APIError) as exc_info:
             api.get_ticket("999")
         assert exc_info.value.status_code == 404
+
+    @responses.activate
+    def test_caller_params_are_not_mutated(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"Result": "Success"}, status=200)
+        params = {"TicketID": "100"}
+        api._request("GetTicket", params=params)
+        assert params == {"TicketID": "100"}
+        request_url = responses.calls[0].request.url or ""
+        assert "Key=test-api-key" in request_url
+        assert "Action=GetTicket" in request_url
+
+    @responses.activate
+    def test_api_key_can_be_changed(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"Result": "Success"}, status=200)
+        api.api_key = "rotated-key"
+        api._request("GetTicket")
+        assert "Key=rotated-key" in (responses.calls[0].request.url or "")
+
+    @responses.activate
+    def test_non_utf8_response_falls_back_to_text(self, api: HelpdeskAPI) -> None:
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            body="caf\xe9".encode("latin-1"),
+            status=200,
+            content_type="text/plain; charset=latin-1",
+        )
+        assert api._request("GetTicket") == "café"
+
+    @responses.activate
+    def test_non_utf8_json_uses_declared_charset(self, api: HelpdeskAPI) -> None:
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            body='{"Name": "Jos\xe9"}'.encode("latin-1"),
+            status=200,
+            content_type="application/json; charset=iso-8859-1",
+        )
+        assert api._request("SearchUsers") == {"Name": "José"}
+
+
+# ------------------------------------------------------------------
+# Retries
+# ------------------------------------------------------------------
+
+
+class TestRetries:
+    @responses.activate
+    def test_retries_server_error_then_succeeds(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, body="Service Unavailable", status=503)
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        result = api.get_ticket("100")
+        assert result["TicketID"] == "100"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_retries_rate_limited_post(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.POST, BASE_URL, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.POST, BASE_URL, json={"Result": "Success"}, status=200)
+        result = api.add_note(ticket_id="100", text="A note", email="a@b.com")
+        assert result["Result"] == "Success"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    @pytest.mark.parametrize("status", [500, 502, 504])
+    def test_post_server_errors_are_not_retried(self, api: HelpdeskAPI, status: int) -> None:
+        responses.add(responses.POST, BASE_URL, body="Server Error", status=status)
+        with pytest.raises(APIError):
+            api.create_ticket(subject="S", description="D", email="a@b.com")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_post_rate_limit_without_retry_after_is_not_retried(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.POST, BASE_URL, body="Too Many Requests", status=429)
+        with pytest.raises(APIError):
+            api.add_note(ticket_id="100", text="A note", email="a@b.com")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, body="Bad Gateway", status=502)
+        with pytest.raises(APIError) as exc_info:
+            api.get_ticket("100")
+        assert exc_info.value.status_code == 502
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_client_errors_are_not_retried(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, body="Not Found", status=404)
+        with pytest.raises(APIError):
+            api.get_ticket("100")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retries_disabled(self, cert_file: str) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=cert_file, max_retries=0)
+        responses.add(responses.GET, BASE_URL, body="Service Unavailable", status=503)
+        with pytest.raises(APIError, match="503"):
+            api.get_ticket("100")
+        assert len(responses.calls) == 1
+
+    def test_adapter_mounted_with_pool_and_retry(self, api: HelpdeskAPI) -> None:
+        adapter = api.session.get_adapter(BASE_URL)
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.backoff_jitter == 0.5
+        assert adapter.max_retries.respect_retry_after_header is True
+        assert 503 in (adapter.max_retries.status_forcelist or ())
+
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    def test_retries_connection_errors(self, closed_port_url: str, retry_sleeps: list[float], method: str) -> None:
+        api = HelpdeskAPI(base_url=closed_port_url, api_key="key", backoff_jitter=0)
+        with pytest.raises(APIError, match="Request failed"):
+            if method == "GET":
+                api.get_ticket("100")
+            else:
+                api.add_note(ticket_id="100", text="A note", email="a@b.com")
+        assert retry_sleeps == [1.0, 2.0, 4.0]
+
+    def test_honours_retry_after(self, scripted_server: ScriptedServer, retry_sleeps: list[float]) -> None:
+        scripted_server.replies = [
+            (429, {"Retry-After": "7"}, b"Too Many Requests"),
+            (200, {"Content-Type": "application/json"}, b'{"Result": "Success"}'),
+        ]
+        api = HelpdeskAPI(base_url=scripted_server.url, api_key="key")
+        assert api.add_note(ticket_id="100", text="A note", email="a@b.com") == {"Result": "Success"}
+        assert scripted_server.methods == ["POST", "POST"]
+        assert retry_sleeps == [7.0]
+
+    @pytest.mark.parametrize("retry_after", ["0", "Wed, 21 Oct 2015 07:28:00 GMT"])
+    def test_zero_retry_after_retries_immediately(
+        self, api: HelpdeskAPI, retry_sleeps: list[float], retry_after: str
+    ) -> None:
+        retry = api.session.get_adapter(BASE_URL).max_retries
+        response = HTTPResponse(status=503, headers={"Retry-After": retry_after})
+        retry.increment("GET", BASE_URL, response=response).sleep(response)
+        assert retry_sleeps == []
+
+    @pytest.mark.parametrize(("retry_after", "expected"), [("7", 7.0), ("3600", 30.0)])
+    def test_retry_after_is_capped_at_backoff_max(
+        self, api: HelpdeskAPI, retry_sleeps: list[float], retry_after: str, expected: float
+    ) -> None:
+        retry = api.session.get_adapter(BASE_URL).max_retries
+        response = HTTPResponse(status=429, headers={"Retry-After": retry_after})
+        retry.increment("GET", BASE_URL, response=response).sleep(response)
+        assert retry_sleeps == [expected]
+
+    def test_first_retry_backs_off(self, cert_file: str, retry_sleeps: list[float]) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", cert_path=cert_file, backoff_base=2.0, backoff_jitter=0)
+        retry = api.session.get_adapter(BASE_URL).max_retries
+        response = HTTPResponse(status=503)
+        retry = retry.increment("GET", BASE_URL, response=response)
+        retry.sleep(response)
+        retry.increment("GET", BASE_URL, response=response).sleep(response)
+        assert retry_sleeps == [2.0, 4.0]
+
+
+# ------------------------------------------------------------------
+# Response cache
+# ------------------------------------------------------------------
+
+
+class TestCache:
+    @responses.activate
+    def test_repeated_get_ticket_is_cached(self, api: HelpdeskAPI) -> None:
+        responses.add(
+            responses.GET,
+            BASE_URL,
+            json={"TicketID": "100", "Description": "<p>Hello</p>"},
+            status=200,
+        )
+        first = api.get_ticket("100")
+        second = api.get_ticket("100")
+        assert first == second == {"TicketID": "100", "Description": "Hello"}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_cached_results_are_independent_copies(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"UserID": "42"}, status=200)
+        api.get_user("u@example.com")["UserID"] = "mutated"
+        assert api.get_user("u@example.com")["UserID"] == "42"
+
+    @responses.activate
+    def test_different_params_are_not_shared(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"Tickets": []}, status=200)
+        api.search_tickets(state="Open")
+        api.search_tickets(state="Closed")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_edit_ticket_invalidates_ticket_and_searches(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100", "State": "Open"}, status=200)
+        responses.add(responses.POST, BASE_URL, json={"Result": "Success"}, status=200)
+        api.get_ticket("100")
+        api.get_ticket("200")
+        api.search_tickets(state="Open")
+        api.edit_ticket(ticket_id="100", state="Closed", ticket_type="Network", email="a@b.com")
+        api.get_ticket("100")
+        api.get_ticket("200")
+        api.search_tickets(state="Open")
+        # GetTicket(100) and SearchTickets are fetched again; GetTicket(200) stays cached
+        assert len(responses.calls) == 6
+
+    @responses.activate
+    def test_failed_edit_still_invalidates_ticket(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100", "State": "Open"}, status=200)
+        responses.add(responses.POST, BASE_URL, body="Internal Server Error", status=500)
+        api.get_ticket("100")
+        with pytest.raises(APIError, match="500"):
+            api.edit_ticket(ticket_id="100", state="Closed", ticket_type="Network", email="a@b.com")
+        api.get_ticket("100")
+        assert [call.request.method for call in responses.calls] == ["GET", "POST", "GET"]
+
+    @responses.activate
+    def test_add_note_invalidates_ticket(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        responses.add(responses.POST, BASE_URL, json={"Result": "Success"}, status=200)
+        api.get_ticket("100")
+        api.add_note(ticket_id="100", text="A note", email="a@b.com")
+        api.get_ticket("100")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_clear_cache(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        api.get_ticket("100")
+        api.clear_cache()
+        api.get_ticket("100")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_non_json_responses_are_not_cached(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, body="Invalid key", status=200)
+        responses.add(responses.GET, BASE_URL, json={"UserID": "42"}, status=200)
+        with pytest.raises(APIError, match="non-JSON"):
+            api.get_user("u@example.com")
+        assert api.get_user("u@example.com") == {"UserID": "42"}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_changing_api_key_clears_cache(self, api: HelpdeskAPI) -> None:
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        api.get_ticket("100")
+        api.api_key = "other-key"
+        api.get_ticket("100")
+        assert len(responses.calls) == 2
+        assert "Key=other-key" in (responses.calls[1].request.url or "")
+
+    @responses.activate
+    def test_zero_ttl_disables_cache(self) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", cache_ttl=0)
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        api.get_ticket("100")
+        api.get_ticket("100")
+        assert len(responses.calls) == 2
+
+
+# ------------------------------------------------------------------
+# Circuit breaker
+# ------------------------------------------------------------------
+
+
+class TestCircuitBreaker:
+    @responses.activate
+    def test_opens_after_repeated_server_errors(self) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", max_retries=0)
+        responses.add(responses.GET, BASE_URL, body="Service Unavailable", status=503)
+        for _ in range(5):
+            with pytest.raises(APIError, match="503"):
+                api.get_ticket("100")
+        with pytest.raises(CircuitOpenError):
+            api.get_ticket("100")
+        assert len(responses.calls) == 5
+
+    @responses.activate
+    @pytest.mark.parametrize("status", [501, 507, 520])
+    def test_other_server_errors_open_circuit(self, status: int) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", max_retries=0)
+        responses.add(responses.GET, BASE_URL, body="Server Error", status=status)
+        for _ in range(5):
+            with pytest.raises(APIError, match=str(status)):
+                api.get_ticket("100")
+        with pytest.raises(CircuitOpenError):
+            api.get_ticket("100")
+
+    @responses.activate
+    def test_client_errors_do_not_open_circuit(self) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", max_retries=0)
+        responses.add(responses.GET, BASE_URL, body="Not Found", status=404)
+        for _ in range(6):
+            with pytest.raises(APIError) as exc_info:
+                api.get_ticket("100")
+            assert not isinstance(exc_info.value, CircuitOpenError)
+        assert len(responses.calls) == 6
+
+    @responses.activate
+    def test_timeout_counts_as_failure(self) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", max_retries=0)
+        api._breaker = CircuitBreaker(failure_threshold=1)
+        responses.add(responses.GET, BASE_URL, body=requests.ConnectTimeout("timed out"))
+        with pytest.raises(APIError, match="timed out"):
+            api.get_ticket("100")
+        with pytest.raises(CircuitOpenError):
+            api.get_ticket("100")
+
+    @responses.activate
+    def test_interrupted_probe_releases_circuit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", max_retries=0)
+        api._breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        responses.add(responses.GET, BASE_URL, body="Service Unavailable", status=503)
+        responses.add(responses.GET, BASE_URL, json={"TicketID": "100"}, status=200)
+        with pytest.raises(APIError, match="503"):
+            api.get_ticket("100")
+
+        def interrupt(*args: object, **kwargs: object) -> None:
+            raise KeyboardInterrupt
+
+        with monkeypatch.context() as patch:
+            patch.setattr(api.session, "get", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                api.get_ticket("100")
+        assert api.get_ticket("100") == {"TicketID": "100"}
+
+
+# ------------------------------------------------------------------
+# Debug logging
+# ------------------------------------------------------------------
+
+
+class TestDebugLogging:
+    @responses.activate
+    def test_logs_status_and_size_without_body(self, api: HelpdeskAPI, caplog: pytest.LogCaptureFixture) -> None:
+        responses.add(responses.GET, BASE_URL, json={"Secret": "token"}, status=200)
+        with caplog.at_level(logging.DEBUG, logger="lansweeper_helpdesk"):
+            api.get_user("u@example.com")
+        assert "status=200 bytes=19" in caplog.text
+        assert "token" not in caplog.text
+
+    @responses.activate
+    def test_debug_bodies_truncates(self, caplog: pytest.LogCaptureFixture) -> None:
+        api = HelpdeskAPI(base_url=BASE_URL, api_key="key", debug_bodies=True)
+        responses.add(responses.GET, BASE_URL, body="x" * 5000, status=200)
+        with caplog.at_level(logging.DEBUG, logger="lansweeper_helpdesk"):
+            api._request("SearchUsers")
+        body_records = [r.getMessage() for r in caplog.records if r.getMessage().startswith("body=")]
+        assert len(body_records) == 1
+        assert body_records[0].count("x") == 2048